@@ -42,9 +42,21 @@ export async function GET() {
   console.log('Found profiles:', profiles?.length || 0)
   console.log('Found company data records:', companyData?.length || 0)
 
+  // Group company data by user once so the join is a lookup per profile
+  // rather than a scan of every company data record
+  const companyDataByUser = new Map<string, NonNullable<typeof companyData>>()
+  companyData?.forEach(record => {
+    const records = companyDataByUser.get(record.user_id)
+    if (records) {
+      records.push(record)
+    } else {
+      companyDataByUser.set(record.user_id, [record])
+    }
+  })
+
   // Manually join the data and count actual companies
   const users = profiles?.map(profile => {
-    const userCompanyData = companyData?.filter(data => data.user_id === profile.id) || []
+    const userCompanyData = companyDataByUser.get(profile.id) || []
 
     // Count actual companies - check multiple possible column names and structures
     let companyCount = 0
@@ -69,9 +81,6 @@ export async function GET() {
       }
     })
 
-    const hasData = companyCount > 0 || userCompanyData.length > 0
-    console.log(`User ${profile.email} (ID: ${profile.id}): ${hasData ? `${companyCount} companies` : 'NO DATA'}`)
-
     return {
       ...profile,
       user_company_data: userCompanyData,
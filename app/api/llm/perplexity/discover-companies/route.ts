@@ -10,6 +10,13 @@ interface CompanyDiscoveryRequest {
   wantToHave: string[];
 }
 
+/**
+ * Upper bound on the raw request body. Every field is truncated during
+ * sanitization, so a legitimate profile is only a few KB; anything larger
+ * is rejected before it is buffered and parsed.
+ */
+const MAX_REQUEST_BYTES = 64 * 1024;
+
 /**
  * Sanitize user input to prevent injection attacks
  * - Removes SQL injection attempts
@@ -91,6 +98,17 @@ function validateAndSanitizeRequest(raw: any): CompanyDiscoveryRequest | null {
  */
 export async function POST(request: NextRequest) {
   try {
+    const contentLength = Number(request.headers.get('content-length'));
+    if (contentLength > MAX_REQUEST_BYTES) {
+      return NextResponse.json(
+        {
+          success: false,
+          error: `Request body too large (max ${MAX_REQUEST_BYTES} bytes)`
+        },
+        { status: 413 }
+      );
+    }
+
     const rawRequest = await request.json();
 
     // Validate and sanitize all input
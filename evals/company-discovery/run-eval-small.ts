@@ -206,13 +206,13 @@ function scoreResult(testCase: DiscoveryTestCase, actual: EvalResult['actual']):
  * Run evaluation on a single test case
  */
 async function evaluateTestCase(testCase: DiscoveryTestCase): Promise<EvalResult> {
-  const startTime = Date.now();
+  const startTime = performance.now();
 
   try {
     // Call the API
     const result = await discoverCompanies(testCase.input);
 
-    const latency = Date.now() - startTime;
+    const latency = performance.now() - startTime;
 
     if (!result.success || !result.data) {
       throw new Error(result.error || 'API returned unsuccessful response');
@@ -290,7 +290,7 @@ async function evaluateTestCase(testCase: DiscoveryTestCase): Promise<EvalResult
       tokensUsed: result.usage.tokensUsed,
     };
   } catch (error) {
-    const latency = Date.now() - startTime;
+    const latency = performance.now() - startTime;
     return {
       testCase,
       actual: {
@@ -91,10 +91,10 @@ async function extractCompanies(input: any) {
 }
 
 async function evaluateTestCase(testCase: any) {
-  const startTime = Date.now();
+  const startTime = performance.now();
   try {
     const result = await extractCompanies(testCase.input);
-    const latency = Date.now() - startTime;
+    const latency = performance.now() - startTime;
     const extracted = result.companies?.[0] || {};
     const scores = scoreResult(testCase, extracted);
 
@@ -118,7 +118,7 @@ async function evaluateTestCase(testCase: any) {
 
     return { testCase, actual: extracted, scores, latency };
   } catch (error: any) {
-    const latency = Date.now() - startTime;
+    const latency = performance.now() - startTime;
     return {
       testCase,
       actual: { name: '', url: '', careerUrl: '' },
@@ -136,13 +136,13 @@ function scoreResult(testCase: TestCase, actual: any): EvalResult['scores'] {
  * Run evaluation on a single test case
  */
 async function evaluateTestCase(testCase: TestCase): Promise<EvalResult> {
-  const startTime = Date.now();
+  const startTime = performance.now();
 
   try {
     // Call the API
     const result = await extractCompanies(testCase.input);
 
-    const latency = Date.now() - startTime;
+    const latency = performance.now() - startTime;
 
     // Extract first company (assuming single company per test)
     const extracted = result.companies?.[0] || {};
@@ -192,7 +192,7 @@ async function evaluateTestCase(testCase: TestCase): Promise<EvalResult> {
       latency,
     };
   } catch (error) {
-    const latency = Date.now() - startTime;
+    const latency = performance.now() - startTime;
     return {
       testCase,
       actual: { name: '', url: '', careerUrl: '' },
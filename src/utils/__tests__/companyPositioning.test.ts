@@ -2,7 +2,12 @@
  * Tests for companyPositioning utilities
  */
 
-import { generateCareerUrl, resolveCareerUrl } from '../companyPositioning';
+import {
+  generateCareerUrl,
+  resolveCareerUrl,
+  mapConnectionsToExistingCompanies
+} from '../companyPositioning';
+import { Company } from '../../types';
 
 describe('generateCareerUrl', () => {
   describe('Full URLs with protocol', () => {
@@ -187,3 +192,57 @@ describe('resolveCareerUrl', () => {
     });
   });
 });
+
+describe('mapConnectionsToExistingCompanies', () => {
+  const createCompany = (id: number, name: string, industry: string, connectionTypes = {}): Company => ({
+    id,
+    name,
+    logo: '',
+    careerUrl: '',
+    matchScore: 80,
+    industry,
+    stage: 'Late Stage',
+    location: 'San Francisco, CA',
+    employees: '1000+',
+    remote: 'Hybrid',
+    openRoles: 1,
+    connections: [],
+    connectionTypes,
+    matchReasons: [],
+    color: '#F59E0B'
+  });
+
+  const existingCompanies = [
+    createCompany(1, 'Stripe, Inc.', 'Fintech'),
+    createCompany(2, 'Alphabet', 'Technology'),
+    createCompany(3, 'OpenAI', 'AI/ML'),
+    createCompany(4, 'Payfly', 'Fintech')
+  ];
+
+  test('should resolve names via exact, alias and fuzzy matching', () => {
+    const newCompany = createCompany(10, 'Acme', 'Fintech', {
+      stripe: 'Direct Competitor', // exact after suffix removal
+      Google: 'Industry Partner',  // alias of Alphabet
+      Payflo: 'Similar Stage',     // same industry, edit distance 1
+      Globex: 'Similar Culture'    // no match
+    });
+
+    const result = mapConnectionsToExistingCompanies(newCompany, existingCompanies);
+
+    expect(result.connections).toEqual([1, 2, 4]);
+    expect(result.connectionTypes).toEqual({
+      1: 'Direct Competitor',
+      2: 'Industry Partner',
+      4: 'Similar Stage'
+    });
+  });
+
+  test('should return no connections when there are no existing companies', () => {
+    const newCompany = createCompany(10, 'Acme', 'Fintech', { Stripe: 'Direct Competitor' });
+
+    expect(mapConnectionsToExistingCompanies(newCompany, [])).toEqual({
+      connections: [],
+      connectionTypes: {}
+    });
+  });
+});
@@ -23,6 +23,11 @@ const GRAPH_CENTER = { x: 400, y: 300 };
 const MIN_COMPANY_DISTANCE = 75; // Minimum distance between company centers
 const MAX_PLACEMENT_ATTEMPTS = 144; // Try every 2.5 degrees
 
+// Name normalization patterns, compiled once rather than per call
+const NON_ALPHANUMERIC_PATTERN = /[^a-z0-9\s]/g;
+const WHITESPACE_PATTERN = /\s+/g;
+const BUSINESS_SUFFIX_PATTERN = /\s*(inc|llc|corp|ltd|limited|company|co)\s*$/i;
+
 /**
  * Find the optimal position for a new company in the graph
  * Uses intelligent collision detection and distance-based placement
@@ -260,9 +265,12 @@ export const mapConnectionsToExistingCompanies = (
     return { connections, connectionTypes };
   }
 
+  // Normalize existing names once and share them across every connection lookup
+  const normalizedNames = existingCompanies.map(company => normalizeCompanyName(company.name));
+
   // Enhanced matching logic for explicit connections
   Object.entries(newCompany.connectionTypes).forEach(([companyName, relationshipType]) => {
-    const matchingCompany = findBestCompanyMatch(companyName, existingCompanies);
+    const matchingCompany = findBestCompanyMatch(companyName, existingCompanies, normalizedNames);
     
     if (matchingCompany) {
       connections.push(matchingCompany.id);
@@ -275,39 +283,41 @@ export const mapConnectionsToExistingCompanies = (
 
 /**
  * Find the best matching company using fuzzy matching algorithms
+ * `normalizedNames[i]` must be the normalized name of `companies[i]`
  */
-const findBestCompanyMatch = (searchName: string, companies: Company[]): Company | null => {
+const findBestCompanyMatch = (
+  searchName: string,
+  companies: Company[],
+  normalizedNames: string[]
+): Company | null => {
   const normalizedSearch = normalizeCompanyName(searchName);
   
   // Strategy 1: Exact match (case-insensitive)
-  let match = companies.find(c => 
-    normalizeCompanyName(c.name) === normalizedSearch
-  );
-  if (match) return match;
+  let index = normalizedNames.indexOf(normalizedSearch);
+  if (index !== -1) return companies[index];
   
   // Strategy 2: Partial match (contains)
-  match = companies.find(c => {
-    const normalizedCompanyName = normalizeCompanyName(c.name);
-    return normalizedCompanyName.includes(normalizedSearch) ||
-           normalizedSearch.includes(normalizedCompanyName);
-  });
-  if (match) return match;
+  index = normalizedNames.findIndex(normalizedCompanyName =>
+    normalizedCompanyName.includes(normalizedSearch) ||
+    normalizedSearch.includes(normalizedCompanyName)
+  );
+  if (index !== -1) return companies[index];
   
   // Strategy 3: Common tech company aliases
   const aliases = getCompanyAliases(normalizedSearch);
   for (const alias of aliases) {
-    match = companies.find(c => normalizeCompanyName(c.name) === alias);
-    if (match) return match;
+    index = normalizedNames.indexOf(alias);
+    if (index !== -1) return companies[index];
   }
   
   // Strategy 4: Industry-based fuzzy matching
-  match = companies.find(c => {
-    const searchIndustry = inferIndustryFromName(searchName);
-    return c.industry.toLowerCase().includes(searchIndustry) && 
-           levenshteinDistance(normalizedSearch, normalizeCompanyName(c.name)) <= 3;
-  });
+  const searchIndustry = inferIndustryFromName(searchName);
+  index = companies.findIndex((c, i) =>
+    c.industry.toLowerCase().includes(searchIndustry) && 
+    levenshteinDistance(normalizedSearch, normalizedNames[i]) <= 3
+  );
   
-  return match || null;
+  return index !== -1 ? companies[index] : null;
 };
 
 /**
@@ -317,9 +327,9 @@ const normalizeCompanyName = (name: string): string => {
   return name
     .toLowerCase()
     .trim()
-    .replace(/[^a-z0-9\s]/g, '') // Remove special characters
-    .replace(/\s+/g, ' ') // Normalize whitespace
-    .replace(/\s*(inc|llc|corp|ltd|limited|company|co)\s*$/i, '') // Remove business suffixes
+    .replace(NON_ALPHANUMERIC_PATTERN, '') // Remove special characters
+    .replace(WHITESPACE_PATTERN, ' ') // Normalize whitespace
+    .replace(BUSINESS_SUFFIX_PATTERN, '') // Remove business suffixes
     .trim();
 };
 
@@ -342,26 +352,23 @@ const getCompanyAliases = (normalizedName: string): string[] => {
   return aliasMap[normalizedName] || [];
 };
 
+// Industry keyword patterns, checked in order; one alternation per industry
+// replaces a chain of substring checks
+const INDUSTRY_NAME_PATTERNS: Array<[RegExp, string]> = [
+  [/ai|artificial|neural/, 'ai'],
+  [/crypto|blockchain|coin/, 'crypto'],
+  [/finance|pay|bank/, 'fintech'],
+  [/game|gaming/, 'gaming']
+];
+
 /**
  * Infer industry from company name
  */
 const inferIndustryFromName = (companyName: string): string => {
   const name = companyName.toLowerCase();
-  
-  if (name.includes('ai') || name.includes('artificial') || name.includes('neural')) {
-    return 'ai';
-  }
-  if (name.includes('crypto') || name.includes('blockchain') || name.includes('coin')) {
-    return 'crypto';
-  }
-  if (name.includes('finance') || name.includes('pay') || name.includes('bank')) {
-    return 'fintech';
-  }
-  if (name.includes('game') || name.includes('gaming')) {
-    return 'gaming';
-  }
-  
-  return 'technology';
+  const match = INDUSTRY_NAME_PATTERNS.find(([pattern]) => pattern.test(name));
+
+  return match ? match[1] : 'technology';
 };
 
 /**
@@ -452,8 +459,8 @@ export const generateCareerUrl = (companyName: string, domain?: string): string
   // Note: This should rarely be hit with improved domain passing from Extraction API
   const normalizedName = companyName
     .toLowerCase()
-    .replace(/[^a-z0-9\s]/g, '')
-    .replace(/\s+/g, '');
+    .replace(NON_ALPHANUMERIC_PATTERN, '')
+    .replace(WHITESPACE_PATTERN, '');
 
   return `https://${normalizedName}.com/careers`;
 };
@@ -0,0 +1,12 @@
+-- Migration: Index user_invitations.invited_by
+--
+-- Deleting a user (DELETE /api/admin/users/[userId]) removes the invitations
+-- they sent with `WHERE invited_by = $1`, and deleting the profile afterwards
+-- has Postgres check the same foreign key. Without an index both are
+-- sequential scans of user_invitations.
+
+-- ============================================================================
+-- INDEXES
+-- ============================================================================
+
+CREATE INDEX IF NOT EXISTS idx_user_invitations_invited_by ON user_invitations(invited_by);
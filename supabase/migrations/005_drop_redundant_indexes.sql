@@ -0,0 +1,22 @@
+-- Migration: Drop indexes duplicated by UNIQUE constraints
+--
+-- 001_initial_schema.sql created plain btree indexes on columns that already
+-- carry a UNIQUE constraint. Postgres backs every UNIQUE constraint with its
+-- own unique index, so these copies are never preferred by the planner and
+-- only add write amplification on every insert/update.
+--
+--   idx_user_company_data_user_id  duplicates  user_company_data_user_id_key
+--   idx_user_preferences_user_id   duplicates  user_preferences_user_id_key
+--   idx_user_invitations_token     duplicates  user_invitations_invite_token_key
+--   idx_waitlist_email             duplicates  waitlist_email_key
+--
+-- idx_user_invitations_email is kept: email is not unique on user_invitations.
+
+-- ============================================================================
+-- DROP REDUNDANT INDEXES
+-- ============================================================================
+
+DROP INDEX IF EXISTS idx_user_company_data_user_id;
+DROP INDEX IF EXISTS idx_user_preferences_user_id;
+DROP INDEX IF EXISTS idx_user_invitations_token;
+DROP INDEX IF EXISTS idx_waitlist_email;